@@ -1,17 +1,19 @@
 """Submodule providing a function to apply regex patterns to a list of strings and return the best match."""
 
 import re
+from functools import lru_cache
+from typing import Tuple
 
 
-def get_best_match(mapping, index):
+@lru_cache(maxsize=1024)
+def _get_best_key(keys: Tuple, index: Tuple):
+    """Return the key whose patterns best match the provided index."""
     compiled_keys = {
         key: (
             (re.compile(key),) if isinstance(key, str) else [re.compile(k) for k in key]
         )
-        for key in mapping
+        for key in keys
     }
-    if not isinstance(index, tuple):
-        index = (index,)
 
     scores = {
         key: sum(
@@ -20,7 +22,14 @@ def get_best_match(mapping, index):
             for level in index
             for match in pattern.findall(level)
         )
-        for key in mapping
+        for key in keys
     }
 
-    return mapping[max(scores.keys(), key=(lambda key: scores[key]))]
+    return max(scores.keys(), key=(lambda key: scores[key]))
+
+
+def get_best_match(mapping, index):
+    if not isinstance(index, tuple):
+        index = (index,)
+
+    return mapping[_get_best_key(tuple(mapping), index)]
@@ -1,7 +1,11 @@
 """Submodule handling the plotting of the bar labels."""
 
-from typing import Dict, List, Union, Optional
+import operator
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Union, Optional
 
+import numpy as np
 import pandas as pd
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -32,6 +36,54 @@ factors = [
     ("_", float("inf")),
 ]
 
+# Shape of the digits whose string representation is already sanitized,
+# that is integers and floats with at most three decimal digits.
+_SIMPLE_DIGIT = re.compile(r"-?\d+(\.\d{1,3})?")
+
+# Multipliers of the ratio between the width of the axis and the length
+# of the longest label, used to decide whether to rotate the labels.
+_NARROW_ROTATION_FACTOR = 5
+_WIDE_ROTATION_FACTOR = 20
+# Rotation above which labels are considered rotated along the axis.
+_ROTATION_THRESHOLD = 80
+# Rules of the automatic rotation of the labels, indexed by whether the
+# labels are minor and whether the plot is vertical. The labels are
+# rotated when the comparison between the number of unique labels and
+# the scaled ratio holds.
+_AUTO_ROTATION_RULES = {
+    (True, True): (_NARROW_ROTATION_FACTOR, operator.le),
+    (True, False): (_WIDE_ROTATION_FACTOR, operator.le),
+    (False, True): (_WIDE_ROTATION_FACTOR, operator.ge),
+    (False, False): (_NARROW_ROTATION_FACTOR, operator.le),
+}
+
+
+@lru_cache(maxsize=512)
+def _sanitize_digit(digit: float) -> str:
+    """Return the sanitized representation of the provided digit."""
+    return sanitize_ml_labels(digit)
+
+
+@lru_cache(maxsize=128)
+def _sanitize_labels(
+    labels: Tuple,
+    custom_defaults: Optional[Tuple[Tuple[str, Union[Tuple[str, ...], str]], ...]],
+) -> Tuple[str, ...]:
+    """Return the sanitized labels, memoized on the frozen custom defaults."""
+    return tuple(
+        sanitize_ml_labels(
+            list(labels),
+            custom_defaults=(
+                None
+                if custom_defaults is None
+                else {
+                    key: value if isinstance(value, str) else list(value)
+                    for key, value in custom_defaults
+                }
+            ),
+        )
+    )
+
 
 def sanitize_digits(digit: float, unit: Optional[str], normalized: bool):
     unit = "" if unit is None else unit
@@ -56,7 +108,45 @@ def sanitize_digits(digit: float, unit: Optional[str], normalized: bool):
                 unit = factor + unit
                 break
 
-    return sanitize_ml_labels(digit) + unit
+    digit_representation = str(digit)
+    if digit_representation.endswith(".0"):
+        digit_representation = digit_representation[:-2]
+    if _SIMPLE_DIGIT.fullmatch(digit_representation):
+        return digit_representation + unit
+
+    return _sanitize_digit(digit) + unit
+
+
+def _dedup_positions(
+    positions: np.ndarray, other_positions: np.ndarray, bump: float
+) -> np.ndarray:
+    """Return the positions shifted by bump where already in other positions.
+
+    Parameters
+    ------------
+    positions: np.ndarray
+        The positions of the labels of the current level.
+    other_positions: np.ndarray
+        The positions of the labels of the previously plotted levels.
+    bump: float
+        The offset to apply to the overlapping positions.
+    """
+    if other_positions.size == 0:
+        return positions
+    other_positions = np.sort(other_positions)
+    indices = np.searchsorted(other_positions, positions)
+    indices[indices == other_positions.size] = other_positions.size - 1
+    return np.where(other_positions[indices] == positions, positions + bump, positions)
+
+
+@lru_cache(maxsize=None)
+def _get_sanitizer(unit: Optional[str], normalized: bool) -> Callable:
+    """Return the tick sanitizer for the provided unit and normalization."""
+
+    def sanitizer(x, *args, **kwargs):
+        return sanitize_digits(x, unit=unit, normalized=normalized)
+
+    return sanitizer
 
 
 def plot_bar_labels(
@@ -106,151 +196,137 @@ def plot_bar_labels(
     sanitize_metrics: bool
         Whether to sanitize the metrics or not.
     """
-    other_positions = set()
+    other_positions = np.empty(0)
+    frozen_custom_defaults = (
+        None
+        if custom_defaults is None
+        else tuple(
+            (key, value if isinstance(value, str) else tuple(value))
+            for key, value in custom_defaults.items()
+        )
+    )
     width = get_max_bar_position(df, bar_width, space_width)
 
     if unique_data_label:
         axes.set_ylabel("")
 
+    value_axis = axes.yaxis if vertical else axes.xaxis
+
     if normalized_metric or absolutely_normalized_metric:
         nbins = 5 if normalized_metric else 8
 
-        if vertical:
-            axes.locator_params(axis="y", nbins=nbins)
-        else:
-            axes.locator_params(axis="x", nbins=nbins)
+        # The locator parameters are only applied when the value axis is not
+        # already using a locator on which they were set by a previous call.
+        locator_settings = (vertical, nbins, value_axis.get_major_locator())
+        if getattr(axes, "_barplots_nbins", None) != locator_settings:
+            axes.locator_params(axis="y" if vertical else "x", nbins=nbins)
+            axes._barplots_nbins = locator_settings
 
-    def sanitizer(x, *args, **kwargs):
-        return sanitize_digits(
-            x, unit=unit, normalized=normalized_metric or absolutely_normalized_metric
-        )
+    sanitizer = _get_sanitizer(unit, normalized_metric or absolutely_normalized_metric)
+    formatter = value_axis.get_major_formatter()
+
+    # The formatter is only replaced when the axis is not already using it.
+    if not (isinstance(formatter, plt.FuncFormatter) and formatter.func is sanitizer):
+        value_axis.set_major_formatter(plt.FuncFormatter(sanitizer))
 
     if vertical:
-        axes.yaxis.set_major_formatter(plt.FuncFormatter(sanitizer))
+        tick_axis, set_ticks, set_ticklabels, alignment = (
+            "x",
+            axes.set_xticks,
+            axes.set_xticklabels,
+            {"ha": "center"},
+        )
     else:
-        axes.xaxis.set_major_formatter(plt.FuncFormatter(sanitizer))
+        tick_axis, set_ticks, set_ticklabels, alignment = (
+            "y",
+            axes.set_yticks,
+            axes.set_yticklabels,
+            {"va": "center"},
+        )
 
-    for level in reversed(range(max(levels - 2, 0), levels)):
-        positions, labels = zip(*text_positions(df, bar_width, space_width, level))
+    applied_tick_params = getattr(axes, "_barplots_tick_params", None)
+    if applied_tick_params is None:
+        applied_tick_params = axes._barplots_tick_params = {}
+
+    # Only the two innermost levels are labelled, starting from the minor one.
+    levels_to_label = [
+        (level, level == levels - 1)
+        for level in range(levels - 1, max(levels - 2, 0) - 1, -1)
+    ]
+
+    for level, minor in levels_to_label:
+        # Levels whose labels are not going to be shown are skipped
+        # before computing any of their positions and labels.
+        if (minor and unique_minor_labels) or (not minor and unique_major_labels):
+            continue
+
+        items = list(text_positions(df, bar_width, space_width, level))
+        positions = np.fromiter(
+            (position for position, _ in items), dtype=np.float64, count=len(items)
+        )
+        labels = tuple(label for _, label in items)
         labels = (
-            sanitize_ml_labels(labels, custom_defaults=custom_defaults)
+            _sanitize_labels(labels, frozen_custom_defaults)
             if sanitize_metrics
             else labels
         )
 
-        max_characters_number_in_labels = max((len(label) for label in labels))
-
-        positions = [round(pos, 5) for pos in positions]
-        positions = [
-            position + width * 0.0002 if position in other_positions else position
-            for position in positions
-        ]
-        other_positions |= set(positions)
-        minor = level == levels - 1
-
-        # Handle the automatic rotation of minor labels.
-        if minor_rotation == "auto":
-            if (
-                minor
-                and len(set(labels)) <= width * 5 / max_characters_number_in_labels
-                and vertical
-            ):
-                adapted_minor_rotation = 90
-            elif (
-                minor
-                and len(set(labels)) <= width * 20 / max_characters_number_in_labels
-                and not vertical
-            ):
-                adapted_minor_rotation = 90
-            else:
-                adapted_minor_rotation = 0
-        else:
-            adapted_minor_rotation = minor_rotation
-
-        # Handle the automatic rotation of major labels.
-        if major_rotation == "auto":
-            if (
-                not minor
-                and len(set(labels)) <= width * 5 / max_characters_number_in_labels
-                and not vertical
-            ):
-                adapted_major_rotation = 90
-            elif (
-                not minor
-                and len(set(labels)) >= width * 20 / max_characters_number_in_labels
-                and vertical
-            ):
-                adapted_major_rotation = 90
+        max_characters_number_in_labels = max(map(len, labels))
+
+        positions = np.round(positions, 5)
+        positions = _dedup_positions(positions, other_positions, width * 0.0002)
+        other_positions = np.concatenate([other_positions, positions])
+
+        # Handle the automatic rotation of the labels.
+        rotation = minor_rotation if minor else major_rotation
+        if rotation == "auto":
+            factor, compare = _AUTO_ROTATION_RULES[(minor, vertical)]
+            threshold = width * factor / max_characters_number_in_labels
+            rotation = 90 if compare(len(set(labels)), threshold) else 0
+
+        set_ticks(positions.tolist(), minor=minor)
+        set_ticklabels(labels, minor=minor, **alignment)
+        if minor:
+            # Major labels are moved away from the axis so that they do not
+            # overlap with the minor labels, which are rotated along the
+            # axis when the rotation matches the orientation of the plot.
+            if (rotation > _ROTATION_THRESHOLD) == vertical:
+                length = 6 * (max_characters_number_in_labels + 1)
             else:
-                adapted_major_rotation = 0
+                length = 20
+            tick_params_settings = (rotation, length)
         else:
-            adapted_major_rotation = major_rotation
+            tick_params_settings = (rotation,)
 
-        if minor and unique_minor_labels:
-            continue
-        if not minor and unique_major_labels:
+        # The tick parameters are only applied when they differ from
+        # the ones applied to the same axis and level by a previous call.
+        if applied_tick_params.get((tick_axis, minor)) == tick_params_settings:
             continue
+        applied_tick_params[(tick_axis, minor)] = tick_params_settings
 
-        if vertical:
-            axes.set_xticks(positions, minor=minor)
-            axes.set_xticklabels(labels, minor=minor, ha="center")
-            if minor:
-                axes.tick_params(
-                    axis="x",
-                    labelsize=9,
-                    which="minor",
-                    labelrotation=adapted_minor_rotation,
-                )
-
-                if adapted_minor_rotation > 80:
-                    length = 6 * (max_characters_number_in_labels + 1)
-                else:
-                    length = 20
-
-                axes.tick_params(
-                    axis="x",
-                    labelsize=10,
-                    which="major",
-                    direction="out",
-                    length=length,
-                    width=0,
-                )
-            else:
-                axes.tick_params(
-                    axis="x",
-                    labelsize=10,
-                    which="major",
-                    labelrotation=adapted_major_rotation,
-                )
+        if minor:
+            axes.tick_params(
+                axis=tick_axis,
+                which="minor",
+                labelsize=9,
+                labelrotation=rotation,
+            )
+            axes.tick_params(
+                axis=tick_axis,
+                which="major",
+                labelsize=10,
+                direction="out",
+                length=length,
+                # This is the size of the actual `tick`
+                # in the plot, which we do not want to show
+                # for the major ticks in this case and therefore
+                # we set it to zero.
+                width=0,
+            )
         else:
-            axes.set_yticks(positions, minor=minor)
-            axes.set_yticklabels(labels, minor=minor, va="center")
-            if minor:
-                axes.tick_params(
-                    axis="y",
-                    which="minor",
-                    labelsize=9,
-                    labelrotation=adapted_minor_rotation,
-                )
-
-                if adapted_minor_rotation > 80:
-                    length = 20
-                else:
-                    length = 6 * (max_characters_number_in_labels + 1)
-
-                axes.tick_params(
-                    axis="y",
-                    which="major",
-                    labelsize=10,
-                    direction="out",
-                    length=length,
-                    # This is the size of the actual `tick`
-                    # in the plot, which we do not want to show
-                    # for the major ticks in this case and therefore
-                    # we set it to zero.
-                    width=0,
-                )
-            else:
-                axes.tick_params(
-                    axis="y", which="major", labelrotation=adapted_major_rotation
-                )
+            axes.tick_params(
+                axis=tick_axis,
+                which="major",
+                labelsize=10,
+                labelrotation=rotation,
+            )
@@ -38,32 +38,36 @@ def plot_boxplots(
     kwargs:Dict,
         Parameters to be passed directly to the plot_boxplot method
     """
-    for x, y, std, index in bar_positions(df, bar_width, space_width):
+    entries = list(bar_positions(df, bar_width, space_width))
+    indices = {index for _, _, _, index in entries}
+
+    def resolve(mapping: Optional[Dict]) -> Dict:
+        """Return the value of the mapping to be used for each unique index."""
+        if mapping is None:
+            return dict.fromkeys(indices)
+        return {
+            index: (
+                mapping[index[-1]]
+                if index[-1] in mapping
+                else get_best_match(mapping, (top_index, *index))
+            )
+            for index in indices
+        }
+
+    resolved_alphas = resolve(alphas)
+    resolved_colors = resolve(colors)
+    resolved_hatch = resolve(hatch)
+
+    for x, y, std, index in entries:
         plot_boxplot(
             axes=axes,
             x=x,
             y=y,
             std=std,
             bar_width=bar_width,
-            alpha=(
-                alphas[index[-1]]
-                if index[-1] in alphas
-                else get_best_match(alphas, (top_index, *index))
-            ),
-            color=(
-                colors[index[-1]]
-                if index[-1] in colors
-                else get_best_match(colors, (top_index, *index))
-            ),
-            hatch=(
-                None
-                if hatch is None
-                else (
-                    hatch[index[-1]]
-                    if index[-1] in hatch
-                    else get_best_match(hatch, (top_index, *index))
-                )
-            ),
+            alpha=resolved_alphas[index],
+            color=resolved_colors[index],
+            hatch=resolved_hatch[index],
             label=index[-1],
             **kwargs
         )
@@ -0,0 +1,10 @@
+from barplots.utils.plot_bar_labels import sanitize_digits
+from sanitize_ml_labels import sanitize_ml_labels
+
+
+def test_sanitize_digits():
+    for digit in [0.0, -0.0, 1.0, -2.0, 5, 0.25, 0.123456, 0.1 + 0.2, 12.345, 999.0]:
+        assert sanitize_digits(digit, unit=None, normalized=True) == sanitize_ml_labels(
+            digit
+        )
+    assert sanitize_digits(1500.0, unit="s", normalized=False) == "1.5Ks"